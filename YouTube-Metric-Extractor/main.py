@@ -15,21 +15,49 @@ Features:
 Usage:
     python main.py
 """
+import csv
+import hashlib
 import json
+import os
+import queue
+import threading
+import time
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
-
-import pandas as pd
-from dateutil import parser as dateparse
+from functools import lru_cache
+from itertools import compress
 
 from youtube_edu_analyzer.config import load_api_key
-from youtube_edu_analyzer.youtube_client import YouTubeClient
-from youtube_edu_analyzer.analysis import extract_channel_identifier, analyze_channel
-from youtube_edu_analyzer.insights import aggregate_insights
+from youtube_edu_analyzer.youtube_client import YouTubeClient, NOT_MODIFIED, CHANNEL_ID_RE
+from youtube_edu_analyzer.cache import MetadataCache, DEFAULT_CACHE_PATH
+# The analysis/insights modules pull in pandas and numpy, which take a second
+# or two to import. They are imported where used, and preloaded on a
+# background thread at startup, so the window appears immediately.
 
 
 MAX_VIDEOS_PER_CHANNEL = 200
+MAX_CONCURRENT_CHANNELS = 8  # Channels fetched in parallel (network-bound)
+UI_POLL_INTERVAL_MS = 100  # How often the Tk thread drains worker updates
+LOG_FLUSH_INTERVAL_MS = 100  # How often buffered log lines are written to the log widget
+CHANNEL_CACHE_MAX_AGE = 24 * 3600  # Seconds before cached channel metadata is refetched
+UPLOADS_CACHE_MAX_AGE = 6 * 3600  # Seconds before a channel's upload list is refetched (new videos)
+VIDEO_CACHE_MAX_AGE = 7 * 24 * 3600  # Seconds before cached video details (views, likes) are refetched
+ANALYSIS_CACHE_MAX_AGE = 7 * 24 * 3600  # Seconds a memoized channel analysis is kept
+ANALYSIS_MEMO_MIN_VIDEOS = 200  # Smaller channels are analyzed faster than a cache round-trip pays back
+ANALYSIS_MEMO_VERSION = 1  # Part of the memo key; bump whenever analyze_channel's output changes
+# Each run's analyses are appended here as channels finish (requires pyarrow)
+LAST_RUN_PATH = os.path.join(os.path.dirname(DEFAULT_CACHE_PATH), 'last_run.parquet')
+
+# Time period dropdown options -> number of days to look back ('All time' has no cutoff)
+PERIOD_DAYS = {
+    'Last 7 days': 7,
+    'Last 30 days': 30,
+    'Last 90 days': 90,
+    'Last year': 365,
+}
 
 # CSV Column Header Mapping: Technical name -> Human-readable name
 CSV_COLUMN_HEADERS = {
@@ -56,6 +84,364 @@ CSV_COLUMN_HEADERS = {
     'engagement_rate_overall_pct': 'Overall Engagement Rate %'
 }
 
+# Column order and headers of the exported CSV, computed once at import
+CSV_OUTPUT_ORDER = list(CSV_COLUMN_HEADERS.keys())
+CSV_OUTPUT_HEADERS = [CSV_COLUMN_HEADERS[k] for k in CSV_OUTPUT_ORDER]
+
+
+def _to_json(x):
+    # Unicode (emojis, etc.) is kept as-is rather than \u-escaped
+    return json.dumps(x, ensure_ascii=False)
+
+
+def _dumps_list(x):
+    if x is None:
+        return ''
+    return _to_json(x) if x else '[]'
+
+
+def _dumps_dict(x):
+    if x is None:
+        return ''
+    return _to_json(x) if x else '{}'
+
+
+# Columns holding lists/dicts, written to CSV as JSON strings. analyze_channel
+# always produces list[str] / dict[str, int] here, so each column gets a
+# serializer specialised for its type; empty values skip json.dumps entirely.
+JSON_SERIALIZERS = {
+    'top_5_long_titles': _dumps_list,
+    'top_5_shorts_titles': _dumps_list,
+    'cta_counts': _dumps_dict,
+    'top_topics': _dumps_list,
+}
+
+
+@lru_cache(maxsize=1)
+def _arrow_schema():
+    """Fixed pyarrow schema of the export columns, so every written batch matches."""
+    import pyarrow as pa
+
+    titles = pa.list_(pa.string())
+    types = {
+        'channel_id': pa.string(),
+        'channel_title': pa.string(),
+        'subscribers': pa.int64(),
+        'channel_total_views': pa.int64(),
+        'sample_videos_analyzed': pa.int64(),
+        'top_5_long_titles': titles,
+        'top_5_shorts_titles': titles,
+        # Keyword sets differ per channel, so store a map rather than a struct
+        'cta_counts': pa.map_(pa.string(), pa.int64()),
+        'top_topics': titles,
+        'est_views_next_6_months': pa.int64(),
+        'est_subs_next_6_months': pa.int64(),
+        'monetization_inference': pa.string(),
+    }
+    # Everything else is a rounded average/rate
+    return pa.schema([(k, types.get(k, pa.float64())) for k in CSV_OUTPUT_ORDER])
+
+
+def _analyses_to_arrow(analyses):
+    """Build a pyarrow Table of the export columns, keeping lists and dicts native."""
+    import pyarrow as pa
+
+    schema = _arrow_schema()
+    arrays = []
+    for field in schema:
+        values = [row.get(field.name) for row in analyses]
+        if field.name == 'cta_counts':
+            values = [list(v.items()) if v is not None else None for v in values]
+        arrays.append(pa.array(values, type=field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+class _RunWriter:
+    """Appends analyses to a temporary Parquet file that replaces LAST_RUN_PATH on close().
+
+    A Parquet file is only readable once its footer is written, so the
+    previous LAST_RUN_PATH stays in place until the run's file is complete.
+    The fetch thread writes while the window-close handler may close, so
+    both go through a lock; writes after close() are ignored.
+    """
+
+    def __init__(self, writer, tmp_path):
+        self._writer = writer
+        self._tmp_path = tmp_path
+        self._lock = threading.Lock()
+
+    def write(self, analyses):
+        with self._lock:
+            if self._writer:
+                self._writer.write_table(_analyses_to_arrow(analyses))
+
+    def close(self):
+        with self._lock:
+            writer, self._writer = self._writer, None
+            if writer is None:
+                return
+            try:
+                writer.close()
+            except Exception:
+                # Without a footer the file is unreadable; keep the previous run
+                try:
+                    os.remove(self._tmp_path)
+                except OSError:
+                    pass
+                raise
+            os.replace(self._tmp_path, LAST_RUN_PATH)
+
+
+def _open_run_writer():
+    """Start writing a new LAST_RUN_PATH Parquet file, or return None if pyarrow is missing."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        return None
+    os.makedirs(os.path.dirname(LAST_RUN_PATH), exist_ok=True)
+    tmp_path = LAST_RUN_PATH + '.tmp'
+    return _RunWriter(pq.ParquetWriter(tmp_path, _arrow_schema(), compression='zstd'), tmp_path)
+
+
+def _preload_analysis_modules():
+    import youtube_edu_analyzer.analysis  # noqa: F401
+    import youtube_edu_analyzer.insights  # noqa: F401
+
+
+def _published_at(video):
+    # The API always includes snippet.publishedAt, so index directly and only
+    # pay for the exception on the rare malformed item
+    try:
+        return video['snippet']['publishedAt']
+    except (KeyError, TypeError):
+        return None
+
+
+def _parse_published(video_items):
+    """Parse every publish date in one vectorized pass, as naive UTC datetime64 (NaT if missing)."""
+    from youtube_edu_analyzer.analysis import parse_published_dates
+    return parse_published_dates([_published_at(v) for v in video_items])
+
+
+def _date_mask(published, from_dt=None, to_dt=None):
+    """Boolean mask of the publish dates within [from_dt, to_dt] (inclusive).
+
+    ``published`` comes from _parse_published and the bounds are naive UTC
+    datetimes, as returned by resolve_date_range. Missing or unparseable
+    dates (NaT) are always excluded.
+    """
+    # Compare plain datetime64 arrays; NaT compares False, so it is only
+    # excluded explicitly when there is no bound to do it
+    import numpy as np
+
+    mask = ~np.isnat(published)
+    if from_dt is not None:
+        mask &= published >= np.datetime64(from_dt)
+    if to_dt is not None:
+        mask &= published <= np.datetime64(to_dt)
+    return mask
+
+
+def _local_to_utc(dt):
+    # Naive local time -> naive UTC (None passes through)
+    return dt.astimezone(timezone.utc).replace(tzinfo=None) if dt is not None else None
+
+
+def resolve_date_range(use_custom, from_date_str, to_date_str, period):
+    """Turn the filter settings into ``(from_dt, to_dt, description)``, or None for no filter.
+
+    The custom date range takes precedence over the period dropdown. Bounds are
+    returned as naive UTC datetimes, computed once per run, so filtering can
+    compare them directly with the (UTC) publish dates. Raises ValueError for
+    malformed or inverted custom dates.
+    """
+    if use_custom and (from_date_str or to_date_str):
+        # Parse custom date range
+        # Note: Input dates are assumed to be in local timezone
+        # Start date: set to 00:00:00 (beginning of day)
+        # End date: set to 23:59:59.999999 (end of day)
+        from_dt = None
+        to_dt = None
+        if from_date_str:
+            from_dt = datetime.strptime(from_date_str, '%Y-%m-%d')
+            from_dt = from_dt.replace(hour=0, minute=0, second=0, microsecond=0)
+        if to_date_str:
+            to_dt = datetime.strptime(to_date_str, '%Y-%m-%d')
+            to_dt = to_dt.replace(hour=23, minute=59, second=59, microsecond=999999)
+        if from_dt and to_dt and from_dt > to_dt:
+            raise ValueError('From date is after To date')
+        range_desc = []
+        if from_date_str:
+            range_desc.append(f'from {from_date_str}')
+        if to_date_str:
+            range_desc.append(f'to {to_date_str}')
+        return _local_to_utc(from_dt), _local_to_utc(to_dt), f'custom range ({", ".join(range_desc)})'
+
+    # Use period dropdown filter
+    days = PERIOD_DAYS.get(period)
+    if days is None:
+        return None
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return now - timedelta(days=days), None, period
+
+
+def _analysis_key(channel_item, video_items):
+    """Fingerprint analyze_channel's inputs by their API ETags, or None if any is missing.
+
+    Every item the API returns carries an ETag that changes with its content,
+    so equal keys mean the same channel metadata and the same videos, in order.
+    """
+    etags = [channel_item.get('etag'), *(v.get('etag') for v in video_items)]
+    if not all(etags):
+        return None
+    text = f'{ANALYSIS_MEMO_VERSION}|{channel_item.get("id")}|' + '|'.join(etags)
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def prefetch_channels(youtube, idents, log, cache=None, refresh=False):
+    """Look up channels given by canonical ID in bulk (50 per request).
+
+    Only IDs without a fresh cache entry are requested, unless ``refresh`` is
+    set. Returns
+    ``{ident: item}`` for the channels found, to be handed to process_channel;
+    anything missing is simply looked up per channel as before.
+    """
+    ids = [i for i in idents if CHANNEL_ID_RE.match(i)]
+    if cache and not refresh:
+        ids = cache.stale_channel_ids(ids, CHANNEL_CACHE_MAX_AGE)
+    # A single channel gains nothing from the bulk path and would lose the
+    # ETag revalidation in process_channel
+    if len(ids) < 2:
+        return {}
+    try:
+        items = youtube.get_channels_bulk(ids)
+    except ValueError as e:
+        log(f'Bulk channel lookup failed, fetching channels one by one: {e}')
+        return {}
+    log(f'Fetched metadata for {len(items)} of {len(ids)} channels in bulk')
+    return items
+
+
+def process_channel(youtube, ident, date_range, log, cache=None, channel_item=None, refresh=False):
+    """Fetch, filter and analyze a single channel.
+
+    Runs on a worker thread, so it must not touch any Tk state: ``date_range``
+    comes from resolve_date_range (computed once per run) and progress is
+    reported through the ``log`` callable. When a MetadataCache is given,
+    channel, upload-list and video-details responses are served from it
+    where fresh, and stale channel entries are revalidated by ETag. With
+    ``refresh`` set the cache is not read, only updated with the new responses.
+    ``channel_item`` is the channel's metadata if already fetched by
+    prefetch_channels. Returns the analysis dict, or None if the channel was
+    skipped.
+    """
+    log(f'Processing: {ident}')
+    if channel_item is not None:
+        ch = channel_item
+        log('  -> Channel metadata fetched in bulk')
+        if cache:
+            # No ETag: revalidation needs the ETag of a single-channel
+            # channels.list response, which a bulk lookup doesn't return (the
+            # item's own ETag is a different value), so once stale these
+            # entries are refetched in full
+            cache.put_channel(ident, ch)
+    else:
+        ch = cache.get_channel(ident, CHANNEL_CACHE_MAX_AGE) if cache and not refresh else None
+        if ch is not None:
+            log('  -> Channel metadata loaded from cache')
+    if ch is None:
+        # A stale entry can still be revalidated with its ETag, which costs a
+        # bodiless 304 instead of a full response when nothing changed
+        stale, etag = cache.get_channel_etag(ident) if cache and not refresh else (None, None)
+        try:
+            ch, etag = youtube.get_channel_with_etag(ident, etag if stale else None)
+        except ValueError as e:
+            log(f'  -> Error fetching channel {ident}: {e}')
+            return None
+        if ch is NOT_MODIFIED:
+            ch = stale
+            log('  -> Channel unchanged since last fetch; reusing cached metadata')
+        if not ch:
+            log(f'  -> Channel not found: {ident}')
+            return None
+        if cache:
+            cache.put_channel(ident, ch, etag)
+    try:
+        title = ch['snippet']['title']
+    except (KeyError, TypeError):
+        title = None
+    try:
+        uploads = ch['contentDetails']['relatedPlaylists']['uploads']
+    except (KeyError, TypeError):
+        uploads = None
+    if not uploads:
+        log(f'  -> No uploads playlist: {title}')
+        return None
+    # Always fetch all videos (no limit)
+    # Date filtering will be applied after fetching
+    video_ids = cache.get_uploads(uploads, UPLOADS_CACHE_MAX_AGE) if cache and not refresh else None
+    if video_ids is None:
+        log(f'  -> Fetching all videos from channel...')
+        try:
+            video_ids = youtube.get_videos_from_uploads(uploads, max_videos=None)
+        except ValueError as e:
+            log(f'  -> Error fetching videos for {title}: {e}')
+            return None
+        if cache:
+            cache.put_uploads(uploads, video_ids)
+    else:
+        log('  -> Upload list loaded from cache')
+    if not video_ids:
+        log(f'  -> No videos: {title}')
+        return None
+    # Only request details for videos that are not already cached
+    cached_items = cache.get_many(video_ids, VIDEO_CACHE_MAX_AGE) if cache and not refresh else {}
+    missing = [v for v in video_ids if v not in cached_items]
+    log(f'  -> Fetched {len(video_ids)} video IDs; fetching details for {len(missing)} '
+        f'({len(cached_items)} cached)...')
+    new_items = []
+    if missing:
+        try:
+            new_items = youtube.get_videos_details(missing)
+        except ValueError as e:
+            log(f'  -> Error fetching video details for {title}: {e}')
+            return None
+        if cache:
+            cache.put_many(new_items)
+    by_id = dict(cached_items)
+    by_id.update((it.get('id'), it) for it in new_items)
+    # Keep the uploads-playlist order regardless of where each item came from
+    video_items = [by_id[v] for v in video_ids if v in by_id]
+
+    total_fetched = len(video_items)
+    # Publish dates are parsed once and shared by the filter and the analysis
+    published = _parse_published(video_items)
+    if date_range is not None:
+        from_dt, to_dt, filter_description = date_range
+        log(f'  -> Retrieved {total_fetched} videos; applying date filter...')
+        mask = _date_mask(published, from_dt, to_dt)
+        video_items = list(compress(video_items, mask.tolist()))
+        published = published[mask]
+        log(f'  -> Filtered to {len(video_items)} videos within {filter_description} (from {total_fetched} total)')
+    else:
+        log(f'  -> Using all {total_fetched} videos (no date filter applied)')
+    # Re-running with unchanged data (e.g. from the cache) reuses the previous
+    # analysis of large channels instead of recomputing it
+    memo_key = None
+    if cache and len(video_items) >= ANALYSIS_MEMO_MIN_VIDEOS:
+        memo_key = _analysis_key(ch, video_items)
+    analysis = cache.get_analysis(memo_key, ANALYSIS_CACHE_MAX_AGE) if memo_key and not refresh else None
+    if analysis is not None:
+        log('  -> Videos unchanged since a previous run; reusing its analysis')
+    else:
+        from youtube_edu_analyzer.analysis import analyze_channel
+        analysis = analyze_channel(ch, video_items, published)
+        if analysis and memo_key:
+            cache.put_analysis(memo_key, analysis)
+    if analysis:
+        log(f'  -> Done: {analysis["channel_title"]} (subs: {analysis["subscribers"]})')
+    return analysis
+
 
 class App:
     def __init__(self, root):
@@ -70,8 +456,22 @@ class App:
         except Exception:
             pass
         self.youtube = None
+        # Key the current client was built with; the client is reused until it changes
+        self._client_api_key = None
         self.analyses = []
-        self.period_options = ['All time', 'Last 7 days', 'Last 30 days', 'Last 90 days', 'Last year']
+        # LAST_RUN_PATH writer of the run in progress, closed on exit so an
+        # interrupted run still leaves a readable file
+        self._run_writer = None
+        root.protocol('WM_DELETE_WINDOW', self._on_close)
+        # Updates posted by the background fetch thread, applied on the Tk thread
+        self._ui_queue = queue.Queue()
+        # Local cache of API responses; the app still works without it
+        try:
+            self.cache = MetadataCache()
+        except Exception as e:
+            print(f"[WARNING] Metadata cache disabled ({e}).")
+            self.cache = None
+        self.period_options = ['All time', *PERIOD_DAYS]
 
         frm = ttk.Frame(root, padding=15)
         frm.grid(row=0, column=0, sticky='nsew')
@@ -173,10 +573,21 @@ class App:
         self.btn_export = ttk.Button(button_frame, text='💾 Export CSV', command=self.export_csv, width=18)
         self.btn_export.grid(row=0, column=2, sticky='w', padx=5)
         
+        self.btn_export_arrow = ttk.Button(button_frame, text='📦 Export Feather', command=self.export_arrow, width=18)
+        self.btn_export_arrow.grid(row=0, column=3, sticky='w', padx=5)
+        
+        self.btn_clear_cache = ttk.Button(button_frame, text='🗑 Clear Cache', command=self.clear_cache, width=18)
+        self.btn_clear_cache.grid(row=0, column=4, sticky='w', padx=5)
+        
+        # Bypass cached responses for this run (fresh results are still cached)
+        self.force_refresh_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(button_frame, text='Force refresh', 
+                        variable=self.force_refresh_var).grid(row=0, column=5, sticky='w', padx=5)
+        
         # Info label
         info_label = ttk.Label(button_frame, text='Note: Always fetches all videos from each channel', 
                               font=('', 8), foreground='gray')
-        info_label.grid(row=0, column=3, sticky='w', padx=(20, 0))
+        info_label.grid(row=0, column=6, sticky='w', padx=(20, 0))
         current_row += 1
 
         # === Progress Section ===
@@ -210,11 +621,43 @@ class App:
         sizegrip = ttk.Sizegrip(frm)
         sizegrip.grid(row=current_row, column=0, sticky='se')
 
+        # Log lines are buffered and written to the Text widget in batches
+        self._log_queue = deque()
+        self._log_second = None
+        self._log_stamp = ''
+        self.root.after(LOG_FLUSH_INTERVAL_MS, self._flush_log)
+
+        threading.Thread(target=_preload_analysis_modules, daemon=True).start()
+
+    def _log_timestamp(self):
+        # Log lines only show whole seconds, so reformat once per second
+        second = int(time.time())
+        if second != self._log_second:
+            self._log_second = second
+            self._log_stamp = time.strftime('%H:%M:%S', time.localtime(second))
+        return self._log_stamp
+
     def log_msg(self, s):
-        self.log.configure(state='normal')
-        self.log.insert('end', f"{datetime.now().isoformat()} - {s}\n")
-        self.log.see('end')
-        self.log.configure(state='disabled')
+        self._log_queue.append(f"{self._log_timestamp()} - {s}\n")
+
+    def log_batch(self, lines):
+        """Queue several log lines as one chunk sharing a single timestamp."""
+        if not lines:
+            return
+        ts = self._log_timestamp()
+        self._log_queue.append(''.join(f"{ts} - {m}\n" for m in lines))
+
+    def _flush_log(self):
+        """Write all pending log lines with a single insert, then reschedule."""
+        if self._log_queue:
+            pending = []
+            while self._log_queue:
+                pending.append(self._log_queue.popleft())
+            self.log.configure(state='normal')
+            self.log.insert('end', ''.join(pending))
+            self.log.see('end')
+            self.log.configure(state='disabled')
+        self.root.after(LOG_FLUSH_INTERVAL_MS, self._flush_log)
 
     def load_file(self):
         fn = filedialog.askopenfilename(filetypes=[('Text files','*.txt'),('All','*.*')])
@@ -231,212 +674,185 @@ class App:
         if not api_key:
             messagebox.showerror('Missing API key', 'API key not found in config.')
             return
-        try:
-            self.youtube = YouTubeClient(api_key)
-        except Exception as e:
-            messagebox.showerror('API Client error', str(e))
-            return
+        if self.youtube is None or api_key != self._client_api_key:
+            try:
+                # Retries happen on worker threads, so report them through the UI queue
+                self.youtube = YouTubeClient(api_key, on_retry=lambda msg: self._ui_queue.put(('log', [msg])))
+            except Exception as e:
+                messagebox.showerror('API Client error', str(e))
+                return
+            self._client_api_key = api_key
 
         raw = self.text.get('1.0','end').strip()
         if not raw:
             messagebox.showerror('No channels', 'Paste at least one channel URL/ID')
             return
         lines = [l.strip() for l in raw.splitlines() if l.strip()]
-        ids = [extract_channel_identifier(l) for l in lines]
+
+        # Tk variables must only be read on the main thread, and the filter is
+        # the same for every channel, so resolve it once before starting
+        use_custom = self.use_custom_date_var.get()
+        from_date_str = self.from_date_var.get().strip()
+        to_date_str = self.to_date_var.get().strip()
+        try:
+            date_range = resolve_date_range(use_custom, from_date_str, to_date_str, self.period_var.get())
+        except ValueError as e:
+            messagebox.showerror('Invalid date range', f'Use YYYY-MM-DD with From on or before To.\n\n{e}')
+            return
+        if use_custom and not from_date_str and not to_date_str:
+            self.log_msg('Warning: Custom date range enabled but no dates provided; using the time period instead.')
+        refresh = self.force_refresh_var.get()
+        if refresh and self.cache:
+            self.log_msg('Force refresh: ignoring cached responses for this run.')
 
         # Disable buttons during processing and initialize progress
-        total = len(ids)
+        total = len(lines)
         self.analyses = []
-        self.progress.configure(maximum=max(total, 1))
-        self.progress['value'] = 0
-        for btn in (self.btn_load, self.btn_fetch, self.btn_export):
+        self.progress.configure(maximum=max(total, 1), value=0)
+        for btn in (self.btn_load, self.btn_fetch, self.btn_export, self.btn_export_arrow, self.btn_clear_cache):
             try:
                 btn.configure(state='disabled')
             except Exception:
                 pass
-        self.log_msg(f'Starting fetch for {total} channels...')
+        self.log_msg(f'Starting fetch for {total} channels (up to {MAX_CONCURRENT_CHANNELS} in parallel)...')
+
+        # Run the network-bound work off the Tk thread; results come back
+        # through the UI queue, which is drained by _drain_ui_queue
+        threading.Thread(target=self._run_fetch, args=(lines, date_range, refresh), daemon=True).start()
+        self.root.after(UI_POLL_INTERVAL_MS, self._drain_ui_queue)
 
+    def _fetch_one(self, ident, date_range, channel_item=None, refresh=False):
+        """Worker-pool task: process one channel and post its log lines as one block."""
+        lines = []
         try:
-            for idx, ident in enumerate(ids, start=1):
-                # Update progress bar
-                self.progress['value'] = idx - 1
-                self.root.update_idletasks()
+            return process_channel(self.youtube, ident, date_range, lines.append, self.cache, channel_item, refresh)
+        except Exception as e:
+            lines.append(f'  -> Unexpected error processing {ident}: {e}')
+            return None
+        finally:
+            self._ui_queue.put(('log', lines))
 
-                self.log_msg(f'Processing: {ident}')
-                try:
-                    ch = self.youtube.get_channel(ident)
-                except ValueError as e:
-                    self.log_msg(f'  -> Error fetching channel {ident}: {e}')
-                    self.progress['value'] = idx
-                    self.root.update_idletasks()
-                    continue
-                if not ch:
-                    self.log_msg(f'  -> Channel not found: {ident}')
-                    # advance progress and continue
-                    self.progress['value'] = idx
-                    self.root.update_idletasks()
-                    continue
-                title = ch.get('snippet',{}).get('title')
-                uploads = ch.get('contentDetails',{}).get('relatedPlaylists',{}).get('uploads')
-                if not uploads:
-                    self.log_msg(f'  -> No uploads playlist: {title}')
-                    self.progress['value'] = idx
-                    self.root.update_idletasks()
-                    continue
-                # Always fetch all videos (no limit)
-                # Date filtering will be applied after fetching
-                self.log_msg(f'  -> Fetching all videos from channel...')
-                try:
-                    video_ids = self.youtube.get_videos_from_uploads(uploads, max_videos=None)
-                except ValueError as e:
-                    self.log_msg(f'  -> Error fetching videos for {title}: {e}')
-                    self.progress['value'] = idx
-                    self.root.update_idletasks()
-                    continue
-                if not video_ids:
-                    self.log_msg(f'  -> No videos: {title}')
-                    self.progress['value'] = idx
-                    self.root.update_idletasks()
-                    continue
-                self.log_msg(f'  -> Fetched {len(video_ids)} video IDs; fetching details...')
-                try:
-                    video_items = self.youtube.get_videos_details(video_ids)
-                except ValueError as e:
-                    self.log_msg(f'  -> Error fetching video details for {title}: {e}')
-                    self.progress['value'] = idx
-                    self.root.update_idletasks()
-                    continue
-                
-                total_fetched = len(video_items)
-                self.log_msg(f'  -> Retrieved {total_fetched} videos; applying date filter...')
-                # Apply date filter if selected (custom date range takes precedence)
-                filtered = []
-                filter_applied = False
-                filter_description = ''
-                
-                if self.use_custom_date_var.get():
-                    # Use custom date range
-                    from_date_str = self.from_date_var.get().strip()
-                    to_date_str = self.to_date_var.get().strip()
-                    
-                    if not from_date_str and not to_date_str:
-                        self.log_msg(f'  -> Warning: Custom date range enabled but no dates provided. Analyzing all videos.')
-                    else:
+    def _run_fetch(self, lines, date_range, refresh=False):
+        """Background thread: fetch all channels concurrently and aggregate insights."""
+        total = len(lines)
+        results = [None] * total
+        if self.cache:
+            self.cache.reset_stats()
+        try:
+            run_writer = self._run_writer = _open_run_writer()
+        except Exception as e:
+            run_writer = None
+            self._ui_queue.put(('log', [f'Not saving results to {LAST_RUN_PATH}: {e}']))
+        try:
+            from youtube_edu_analyzer.analysis import extract_channel_identifier
+            # Repeated channels (the same URL pasted twice, or a URL and its
+            # ID) are only fetched once
+            idents = list(dict.fromkeys(extract_channel_identifier(line) for line in lines))
+            duplicates = total - len(idents)
+            if duplicates:
+                self._ui_queue.put(('log', [f'Skipping {duplicates} duplicate channel(s)']))
+            prefetch_log = []
+            channel_items = prefetch_channels(self.youtube, idents, prefetch_log.append, self.cache, refresh)
+            if prefetch_log:
+                self._ui_queue.put(('log', prefetch_log))
+            with ThreadPoolExecutor(max_workers=max(1, min(MAX_CONCURRENT_CHANNELS, len(idents)))) as pool:
+                futures = {pool.submit(self._fetch_one, ident, date_range, channel_items.get(ident), refresh): idx
+                           for idx, ident in enumerate(idents)}
+                # Duplicates count as already processed on the progress bar
+                for done, fut in enumerate(as_completed(futures), start=duplicates + 1):
+                    analysis = results[futures[fut]] = fut.result()
+                    if analysis and run_writer:
+                        # Append each result as a row group as soon as it
+                        # arrives, rather than rewriting the file at the end
                         try:
-                            from_dt = None
-                            to_dt = None
-                            
-                            # Parse custom date range
-                            # Note: Input dates are assumed to be in local timezone
-                            # Start date: set to 00:00:00 (beginning of day)
-                            # End date: set to 23:59:59.999999 (end of day)
-                            if from_date_str:
-                                from_dt = datetime.strptime(from_date_str, '%Y-%m-%d')
-                                from_dt = from_dt.replace(hour=0, minute=0, second=0, microsecond=0)
-                            
-                            if to_date_str:
-                                to_dt = datetime.strptime(to_date_str, '%Y-%m-%d')
-                                to_dt = to_dt.replace(hour=23, minute=59, second=59, microsecond=999999)
-                            
-                            if from_dt and to_dt and from_dt > to_dt:
-                                self.log_msg(f'  -> Warning: From date is after To date, skipping date filter')
-                            else:
-                                for v in video_items:
-                                    pub_str = v.get('snippet',{}).get('publishedAt')
-                                    try:
-                                        pub_dt = dateparse.parse(pub_str) if pub_str else None
-                                    except Exception:
-                                        pub_dt = None
-                                    if pub_dt is not None:
-                                        # Convert timezone-aware datetime to naive (local time)
-                                        # This ensures consistent comparison with user-provided dates
-                                        # Note: Videos published near midnight in different timezones
-                                        # may be included/excluded based on local time conversion
-                                        if pub_dt.tzinfo is not None:
-                                            pub_dt = pub_dt.astimezone(tz=None).replace(tzinfo=None)
-                                        # Check if date is within range (inclusive)
-                                        if from_dt and pub_dt < from_dt:
-                                            continue
-                                        if to_dt and pub_dt > to_dt:
-                                            continue
-                                        filtered.append(v)
-                                video_items = filtered
-                                filter_applied = True
-                                range_desc = []
-                                if from_date_str:
-                                    range_desc.append(f'from {from_date_str}')
-                                if to_date_str:
-                                    range_desc.append(f'to {to_date_str}')
-                                filter_description = f'custom range ({", ".join(range_desc)})'
-                        except ValueError as e:
-                            self.log_msg(f'  -> Warning: Invalid date format. Use YYYY-MM-DD. Error: {e}')
-                
-                if not filter_applied:
-                    # Use period dropdown filter
-                    period = self.period_var.get()
-                    cutoff_dt = None
-                    # Get current time in UTC, then convert to naive local time for consistency
-                    now = datetime.now(timezone.utc).astimezone(tz=None).replace(tzinfo=None)
-                    if period == 'Last 7 days':
-                        cutoff_dt = now - timedelta(days=7)
-                    elif period == 'Last 30 days':
-                        cutoff_dt = now - timedelta(days=30)
-                    elif period == 'Last 90 days':
-                        cutoff_dt = now - timedelta(days=90)
-                    elif period == 'Last year':
-                        cutoff_dt = now - timedelta(days=365)
-                    
-                    if cutoff_dt is not None:
-                        for v in video_items:
-                            pub_str = v.get('snippet',{}).get('publishedAt')
-                            try:
-                                pub_dt = dateparse.parse(pub_str) if pub_str else None
-                            except Exception:
-                                pub_dt = None
-                            if pub_dt is not None:
-                                # Convert to naive datetime for comparison
-                                if pub_dt.tzinfo is not None:
-                                    pub_dt = pub_dt.astimezone(tz=None).replace(tzinfo=None)
-                                # Include videos published on or after cutoff date (inclusive)
-                                if pub_dt >= cutoff_dt:
-                                    filtered.append(v)
-                        video_items = filtered
-                        filter_applied = True
-                        filter_description = period
-                
-                if filter_applied:
-                    self.log_msg(f'  -> Filtered to {len(video_items)} videos within {filter_description} (from {total_fetched} total)')
-                else:
-                    self.log_msg(f'  -> Using all {len(video_items)} videos (no date filter applied)')
-                analysis = analyze_channel(ch, video_items)
-                if analysis:
-                    self.analyses.append(analysis)
-                    self.log_msg(f'  -> Done: {analysis["channel_title"]} (subs: {analysis["subscribers"]})')
-
-                # advance progress at end of iteration
-                self.progress['value'] = idx
-                self.root.update_idletasks()
+                            run_writer.write([analysis])
+                        except Exception as e:
+                            self._ui_queue.put(('log', [f'Stopped saving results to {LAST_RUN_PATH}: {e}']))
+                            self._close_run_writer(run_writer)
+                            run_writer = None
+                    self._ui_queue.put(('progress', done))
 
+            # Keep the input order regardless of which channel finished first
+            self.analyses = [a for a in results if a]
             if self.analyses:
-                self.log_msg('Aggregating insights...')
+                log = ['Aggregating insights...']
+                from youtube_edu_analyzer.insights import aggregate_insights
                 insights = aggregate_insights(self.analyses)
                 # Plot generation disabled by default
-                self.log_msg('Top suggestions:')
+                log.append('Top suggestions:')
                 for s in insights.get('suggestions',[]):
-                    self.log_msg(' - ' + s)
+                    log.append(' - ' + s)
                 top_topics = [t for t,c in insights.get('top_overall_topics',[])[:10]]
-                self.log_msg('Top topics overall: ' + ', '.join(top_topics))
+                log.append('Top topics overall: ' + ', '.join(top_topics))
             else:
-                self.log_msg('No analyses produced; check errors above.')
+                log = ['No analyses produced; check errors above.']
+            if self.cache:
+                hits, misses = self.cache.stats()
+                log.append(f'Cache: {hits} hits, {misses} misses')
+            self._ui_queue.put(('log', log))
+        except Exception as e:
+            self._ui_queue.put(('log', [f'Unexpected error during analysis: {e}']))
         finally:
-            # Ensure buttons re-enable and progress completes
-            for btn in (self.btn_load, self.btn_fetch, self.btn_export):
-                try:
-                    btn.configure(state='normal')
-                except Exception:
-                    pass
-            self.progress['value'] = total
-            self.root.update_idletasks()
+            if run_writer:
+                self._close_run_writer(run_writer)
+            self._ui_queue.put(('done', total))
+
+    def _close_run_writer(self, run_writer):
+        try:
+            run_writer.close()
+        except Exception as e:
+            self._ui_queue.put(('log', [f'Could not save results to {LAST_RUN_PATH}: {e}']))
+
+    def _on_close(self):
+        # The fetch thread is a daemon and dies with the window; finish the
+        # results file first so the channels done so far are kept
+        if self._run_writer:
+            try:
+                self._run_writer.close()
+            except Exception:
+                pass
+        self.root.destroy()
+
+    def _drain_ui_queue(self):
+        """Apply log/progress updates posted by the worker thread (main thread only)."""
+        # Several channels can finish between polls; only the latest progress
+        # value matters, so the bar is reconfigured at most once per poll
+        progress = None
+        finished = False
+        try:
+            while not finished:
+                kind, payload = self._ui_queue.get_nowait()
+                if kind == 'log':
+                    self.log_batch(payload)
+                elif kind == 'progress':
+                    progress = payload
+                elif kind == 'done':
+                    progress = payload
+                    finished = True
+        except queue.Empty:
+            pass
+        if progress is not None:
+            self.progress.configure(value=progress)
+        if not finished:
+            self.root.after(UI_POLL_INTERVAL_MS, self._drain_ui_queue)
+            return
+        # Ensure buttons re-enable once the worker is done
+        for btn in (self.btn_load, self.btn_fetch, self.btn_export, self.btn_export_arrow, self.btn_clear_cache):
+            try:
+                btn.configure(state='normal')
+            except Exception:
+                pass
+
+    def clear_cache(self):
+        if self.cache is None:
+            messagebox.showwarning('Cache disabled', 'The metadata cache could not be opened.')
+            return
+        try:
+            self.cache.clear()
+        except Exception as e:
+            messagebox.showerror('Cache error', str(e))
+            return
+        self.log_msg('Cleared cached channel and video metadata.')
 
     def export_csv(self):
         if not self.analyses:
@@ -455,31 +871,21 @@ class App:
         if not fn:
             return
         
-        df = pd.DataFrame(self.analyses)
-        
-        # Expand lists/dicts into JSON strings for CSV friendliness
-        # Use ensure_ascii=False to preserve Unicode characters (emojis, etc.)
-        def safe_json_dumps(x):
-            try:
-                return json.dumps(x, ensure_ascii=False) if x is not None else ''
-            except (TypeError, ValueError):
-                return str(x) if x is not None else ''
-        
-        if 'top_5_long_titles' in df.columns:
-            df['top_5_long_titles'] = df['top_5_long_titles'].apply(safe_json_dumps)
-        if 'top_5_shorts_titles' in df.columns:
-            df['top_5_shorts_titles'] = df['top_5_shorts_titles'].apply(safe_json_dumps)
-        if 'cta_counts' in df.columns:
-            df['cta_counts'] = df['cta_counts'].apply(safe_json_dumps)
-        if 'top_topics' in df.columns:
-            df['top_topics'] = df['top_topics'].apply(safe_json_dumps)
-        
-        # Rename columns to human-readable headers
-        df = df.rename(columns=CSV_COLUMN_HEADERS)
-        
+        # Stream rows straight to disk; no intermediate DataFrame is needed
+        # for a flat table of a few hundred rows
         try:
             # Use UTF-8 encoding to properly handle Unicode characters
-            df.to_csv(fn, index=False, encoding='utf-8-sig')
+            # A large buffer turns the many small row writes into a few syscalls
+            with open(fn, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20) as f:
+                # Platform line endings (CRLF on Windows), as pandas' to_csv writes
+                writer = csv.writer(f, lineterminator=os.linesep)
+                writer.writerow(CSV_OUTPUT_HEADERS)
+                # Pick each column's JSON serializer once, not per cell
+                columns = [(k, JSON_SERIALIZERS.get(k)) for k in CSV_OUTPUT_ORDER]
+                # Expand lists/dicts into JSON strings for CSV friendliness
+                writer.writerows([dumps(row.get(k)) if dumps else row.get(k, '')
+                                  for k, dumps in columns]
+                                 for row in self.analyses)
         except PermissionError:
             messagebox.showerror('Permission denied', 'Close the file if it\'s open and choose another location.')
             self.log_msg(f'Failed to export CSV due to permission error: {fn}')
@@ -491,6 +897,49 @@ class App:
         self.log_msg(f'Exported CSV to {fn}')
         messagebox.showinfo('Exported', f'CSV exported to {fn}')
 
+    def export_arrow(self):
+        """Export to Feather (default) or Parquet for loading back into pandas/pyarrow.
+
+        Unlike the CSV export, list and dict columns are stored natively
+        instead of as JSON strings, and column names are the analysis keys.
+        """
+        if not self.analyses:
+            messagebox.showwarning('No data','Run analysis first')
+            return
+        try:
+            import pyarrow.feather
+            import pyarrow.parquet
+        except ImportError:
+            messagebox.showerror('pyarrow not installed',
+                                 'Feather/Parquet export requires pyarrow.\nInstall it with: pip install pyarrow')
+            return
+
+        timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M')
+        fn = filedialog.asksaveasfilename(
+            defaultextension='.feather',
+            filetypes=[('Feather','*.feather'), ('Parquet','*.parquet')],
+            initialfile=f'youtube_analysis_{timestamp}.feather'
+        )
+        if not fn:
+            return
+
+        try:
+            table = _analyses_to_arrow(self.analyses)
+            if fn.lower().endswith('.parquet'):
+                pyarrow.parquet.write_table(table, fn, compression='zstd')
+            else:
+                pyarrow.feather.write_feather(table, fn, compression='zstd', compression_level=3)
+        except PermissionError:
+            messagebox.showerror('Permission denied', 'Close the file if it\'s open and choose another location.')
+            self.log_msg(f'Failed to export due to permission error: {fn}')
+            return
+        except Exception as e:
+            messagebox.showerror('Export error', str(e))
+            self.log_msg(f'Failed to export: {e}')
+            return
+        self.log_msg(f'Exported to {fn}')
+        messagebox.showinfo('Exported', f'Data exported to {fn}')
+
 
 
 # ----------------------- Run -----------------------
@@ -7,17 +7,25 @@ It extracts metrics, calculates statistics, and generates insights from video da
 Key functions:
 - extract_channel_identifier: Parse channel URLs/IDs
 - analyze_channel: Compute comprehensive metrics for a channel
+- analyze_channels: Analyze many channels in parallel worker processes
 - parse_duration_to_seconds: Convert ISO8601 duration to seconds
+- parse_published_dates: Convert publishedAt strings to naive UTC datetime64
 
 Constants:
 - CTA_WORDS: Call-to-action keywords for marketing analysis
 - COMMUNITY_WORDS: Community-building keywords
 - MONET_WORDS: Monetization-related keywords
+- TOPIC_STOPWORDS: Filler words ignored when extracting topics from titles
 - SHORTS_THRESHOLD_SECONDS: Duration threshold for YouTube Shorts (60s)
 """
 import math
 import re
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+# Shared read-only fallback for missing sub-objects in API items; never mutated
+_EMPTY: dict = {}
 
 def _safe_int(value, default: int = 0) -> int:
 	try:
@@ -39,7 +47,6 @@ def _safe_float(value, default: float = 0.0) -> float:
 		return default
 import numpy as np
 import pandas as pd
-from dateutil import parser as dateparse
 
 
 URL_PATTERNS = [
@@ -49,6 +56,8 @@ URL_PATTERNS = [
 	r"(?:https?://)?(?:www\.)?youtube\.com/(@[A-Za-z0-9_-]+)",
 	r"^([A-Za-z0-9_-]{24,})$",
 ]
+# Compiled once; tried in order, first match wins
+_URL_SEARCHES = [re.compile(p).search for p in URL_PATTERNS]
 
 CTA_WORDS = [
 	'subscribe', 'join', 'enroll', 'download', 'signup', 'sign up', 'visit', 'buy', 'purchase',
@@ -58,6 +67,48 @@ CTA_WORDS = [
 COMMUNITY_WORDS = ['discord','telegram','community','facebook group','paid community','newsletter','live session','q&a','ask your doubt','join us']
 MONET_WORDS = ['sponsor','sponsored','affiliate','udemy','coursera','patreon','merch','adsense','brand']
 
+# Comprehensive stopword list to filter out common filler words
+TOPIC_STOPWORDS = frozenset([
+	# Articles, prepositions, conjunctions
+	'the', 'and', 'for', 'with', 'to', 'a', 'an', 'in', 'of', 'is', 'at', 'by', 'on',
+	# Common verbs
+	'how', 'what', 'learn', 'get', 'make', 'use', 'do', 'can', 'will', 'should',
+	# Tutorial/video-related words
+	'tutorial', 'lesson', 'video', 'introduction', 'session', 'guide', 'course',
+	'part', 'episode', 'series', 'chapter', 'lecture',
+	# Common adjectives/qualifiers
+	'new', 'best', 'top', 'this', 'that', 'your', 'from', 'all', 'about', 'into',
+	'complete', 'full', 'easy', 'simple', 'quick', 'free', 'basic', 'advanced',
+	# Time-related
+	'2023', '2024', '2025', 'today', 'now',
+	# Numbers (filter 1-20 as they're usually not meaningful topics)
+	'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten'
+])
+
+# Title tokens; applied to lowercased text
+_TOKEN_RE = re.compile(r'[a-z0-9+#]+')
+
+# pyahocorasick, when installed, finds all keywords in one pass per description.
+# (A single combined regex cannot replace it: its matches never overlap, so it
+# would miss 'sponsor' inside 'sponsored' or 'course' inside 'free course'.)
+try:
+	import ahocorasick
+except ImportError:
+	ahocorasick = None
+
+
+def _build_keyword_automaton():
+	if ahocorasick is None:
+		return None
+	automaton = ahocorasick.Automaton()
+	for kw in {*CTA_WORDS, *MONET_WORDS, *COMMUNITY_WORDS}:
+		automaton.add_word(kw, kw)
+	automaton.make_automaton()
+	return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
 SHORTS_THRESHOLD_SECONDS = 60  # YouTube's official threshold for Shorts
 FUTURE_WEEKS = 26  # 6 months forecast period
 
@@ -68,6 +119,11 @@ ISO8601_DURATION_RE = re.compile(
 	r'P(?:(\d+)Y)?(?:(\d+)M)?(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?)?'
 )
 
+# (order, seconds) per unit letter for the fast path of parse_duration_to_seconds;
+# 'M' means months before the 'T' and minutes after it
+_DATE_UNITS = {'Y': (0, 365 * 86400), 'M': (1, 30 * 86400), 'W': (2, 7 * 86400), 'D': (3, 86400)}
+_TIME_UNITS = {'H': (4, 3600), 'M': (5, 60), 'S': (6, 1)}
+
 
 def parse_duration_to_seconds(dur: str) -> int:
 	"""Parse ISO8601 duration string to total seconds.
@@ -83,8 +139,31 @@ def parse_duration_to_seconds(dur: str) -> int:
 	
 	Note: Month and year conversions are approximations since actual lengths vary.
 	"""
-	if not dur:
+	if not dur or dur[0] != 'P':
 		return 0
+	# Fast path for the usual whole-number form (e.g. PT1H2M3S): accumulate
+	# digits and add them up at each unit letter in a single scan, without the
+	# regex engine. Fractional seconds and anything out of order go to the regex.
+	total = 0
+	value = None  # digits read since the last unit letter
+	last = -1
+	units = _DATE_UNITS
+	for ch in dur[1:]:
+		if '0' <= ch <= '9':
+			value = (value or 0) * 10 + ord(ch) - 48
+		elif ch == 'T' and units is _DATE_UNITS and value is None:
+			units = _TIME_UNITS
+		else:
+			order, seconds = units.get(ch, (-1, 0))
+			if value is None or order <= last:
+				return _parse_duration_regex(dur)
+			total += value * seconds
+			value = None
+			last = order
+	return total
+
+
+def _parse_duration_regex(dur: str) -> int:
 	m = ISO8601_DURATION_RE.match(dur)
 	if not m:
 		return 0
@@ -111,10 +190,43 @@ def parse_duration_to_seconds(dur: str) -> int:
 	return int(total_seconds)
 
 
+def parse_published_dates(values) -> np.ndarray:
+	"""Parse publishedAt strings into naive UTC datetime64 values (NaT if missing or invalid)."""
+	# The API returns 'YYYY-MM-DDTHH:MM:SSZ', which NumPy casts in C once the
+	# 'Z' is dropped; anything else (offsets, malformed values) goes to pandas
+	if all(s is None or s[-1:] == 'Z' for s in values):
+		try:
+			return np.array([s[:-1] if s else 'NaT' for s in values], dtype='datetime64[us]')
+		except ValueError:
+			pass
+	# format='ISO8601' skips per-call format inference and, unlike inference,
+	# also accepts timestamps with fractional seconds
+	return pd.to_datetime(values, format='ISO8601', errors='coerce', utc=True).tz_convert(None).to_numpy()
+
+
+def _count_column(values) -> np.ndarray:
+	"""Vectorized _safe_int for API count strings; missing or invalid values become 0."""
+	return pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').fillna(0).astype('int64').to_numpy()
+
+
+def _top_n(values: np.ndarray, n: int) -> np.ndarray:
+	"""Indices of the ``n`` largest values, largest first; ties keep row order (like DataFrame.nlargest)."""
+	if n >= len(values):
+		return np.argsort(-values, kind='stable')
+	# Find the n-th largest value with an O(N) partition and sort only the
+	# rows that make the cut; among rows equal to it, the earliest ones win
+	threshold = -np.partition(-values, n - 1)[n - 1]
+	above = np.flatnonzero(values > threshold)
+	tied = np.flatnonzero(values == threshold)[:n - len(above)]
+	idx = np.sort(np.concatenate([above, tied]))
+	return idx[np.argsort(-values[idx], kind='stable')]
+
+
+@lru_cache(maxsize=4096)
 def extract_channel_identifier(url_or_id: str) -> str:
 	url_or_id = url_or_id.strip()
-	for pat in URL_PATTERNS:
-		m = re.search(pat, url_or_id)
+	for search in _URL_SEARCHES:
+		m = search(url_or_id)
 		if m:
 			return m.group(1)
 	if url_or_id.startswith('@'):
@@ -122,9 +234,17 @@ def extract_channel_identifier(url_or_id: str) -> str:
 	return url_or_id
 
 
-def analyze_channel(channel_item, video_items):
-	snippet = channel_item.get('snippet', {})
-	stats = channel_item.get('statistics', {})
+def analyze_channel(channel_item, video_items, published=None):
+	"""Compute the channel metrics dict, or None when there are no videos.
+
+	``published`` optionally holds the videos' publish dates, already parsed
+	as naive UTC datetime64 values in the same order as ``video_items`` (as
+	the date filter produces them); they are parsed here when omitted.
+	"""
+	# `x.get(k) or _EMPTY` neither allocates a dict per call, as `x.get(k, {})`
+	# does, nor on a missing key
+	snippet = channel_item.get('snippet') or _EMPTY
+	stats = channel_item.get('statistics') or _EMPTY
 	title = snippet.get('title')
 	cid = channel_item.get('id')
 
@@ -132,50 +252,50 @@ def analyze_channel(channel_item, video_items):
 	subs = _safe_int(subs_raw, 0) if subs_raw not in (None, '') else None
 	channel_total_views = _safe_int(stats.get('viewCount'), 0)
 
-	videos = []
-	for v in video_items:
-		snip = v.get('snippet', {})
-		cd = v.get('contentDetails', {})
-		st = v.get('statistics', {})
-		pub = dateparse.parse(snip.get('publishedAt')) if snip.get('publishedAt') else None
-		duration = parse_duration_to_seconds(cd.get('duration','PT0S'))
-		views = _safe_int(st.get('viewCount'), 0)
-		likes = _safe_int(st.get('likeCount'), 0)
-		comments = _safe_int(st.get('commentCount'), 0)
-		videos.append({
-			'id': v.get('id'),
-			'title': snip.get('title',''),
-			'description': snip.get('description','') or '',
-			'publishedAt': pub,
-			'duration_seconds': duration,
-			'views': views,
-			'likes': likes,
-			'comments': comments,
-		})
-
-	if not videos:
+	if not video_items:
 		return None
 
-	dfv = pd.DataFrame(videos)
-	# Ensure datetime dtype for publishedAt and drop invalid dates for time-based calcs
-	dfv['publishedAt'] = pd.to_datetime(dfv['publishedAt'], errors='coerce', utc=True)
-	# Convert to naive datetimes (remove timezone info) for consistency in downstream ops
-	# Since utc=True ensures timezone-aware datetimes, safely convert to naive
-	try:
-		if dfv['publishedAt'].dt.tz is not None:
-			dfv['publishedAt'] = dfv['publishedAt'].dt.tz_convert(None)
-	except (AttributeError, TypeError):
-		# If already naive or empty, no conversion needed
-		pass
-	dfv = dfv.sort_values(by='publishedAt')
-	total_videos = len(dfv)
+	# Keep one array (or list) per field rather than a DataFrame: at a few
+	# hundred rows, pandas' per-call overhead costs more than the arithmetic.
+	# Counts and dates are still converted in vectorized passes.
+	snips = [v.get('snippet') or _EMPTY for v in video_items]
+	video_stats = [v.get('statistics') or _EMPTY for v in video_items]
+	if published is None:
+		# YouTube timestamps are UTC; keep them as naive UTC for downstream ops
+		published = parse_published_dates([snip.get('publishedAt') for snip in snips])
+	titles = [snip.get('title','') for snip in snips]
+	descriptions = [snip.get('description','') or '' for snip in snips]
+	duration_seconds = np.array([parse_duration_to_seconds((v.get('contentDetails') or _EMPTY).get('duration','PT0S')) for v in video_items], dtype=np.int64)
+	views = _count_column([st.get('viewCount') for st in video_stats])
+	likes = _count_column([st.get('likeCount') for st in video_stats])
+	comments = _count_column([st.get('commentCount') for st in video_stats])
+
+	# Sort by publish date with undated videos last, in the same order as
+	# DataFrame.sort_values, then reorder every field once
+	dated = ~np.isnat(published)
+	order = np.concatenate([np.flatnonzero(dated)[published[dated].argsort(kind='quicksort')], np.flatnonzero(~dated)])
+	published = published[order]
+	duration_seconds = duration_seconds[order]
+	views = views[order]
+	likes = likes[order]
+	comments = comments[order]
+	titles = [titles[i] for i in order]
+	descriptions = [descriptions[i] for i in order]
+	total_videos = len(order)
+
+	# Split shorts from long videos once, as sorted row indices, and reuse the
+	# split for the counts, runtimes and top titles below
+	shorts_mask = duration_seconds <= SHORTS_THRESHOLD_SECONDS
+	shorts = np.flatnonzero(shorts_mask)
+	longs = np.flatnonzero(~shorts_mask)
 
 	# Use only valid dates for span-based metrics; provide safe fallback if none
-	dfv_dates = dfv.dropna(subset=['publishedAt'])
-	if not dfv_dates.empty:
-		first_date = dfv_dates['publishedAt'].iloc[0]
-		last_date = dfv_dates['publishedAt'].iloc[-1]
-		days_span = (last_date - first_date).days
+	# (after sorting, the dated videos are the first dated_videos_count rows)
+	dated_videos_count = int(dated.sum())
+	if dated_videos_count:
+		first_date = published[0]
+		last_date = published[dated_videos_count - 1]
+		days_span = int((last_date - first_date) // np.timedelta64(1, 'D'))
 		
 		# Edge case handling for upload frequency calculations:
 		# - Same-day uploads: use 1 day span
@@ -186,15 +306,14 @@ def analyze_channel(channel_item, video_items):
 		
 		# For single-video channels, use minimum 1 week to avoid showing
 		# unrealistic rates like "7 uploads/week" for a channel with 1 video
-		if len(dfv_dates) == 1:
+		if dated_videos_count == 1:
 			weeks_span = 1.0  # Treat as 1 week minimum
 		else:
 			weeks_span = max(days_span / 7.0, 1.0 / 7.0)  # Minimum 1 day = 1/7 week
 		
 		# Count videos with valid dates for accurate per-week calculations
-		dated_videos_count = len(dfv_dates)
-		shorts_mask_dated = dfv_dates['duration_seconds'] <= SHORTS_THRESHOLD_SECONDS
-		shorts_count_dated = shorts_mask_dated.sum()
+		# (the dated rows come first, so count the shorts before that cut-off)
+		shorts_count_dated = np.searchsorted(shorts, dated_videos_count)
 		longs_count_dated = dated_videos_count - shorts_count_dated
 	else:
 		weeks_span = 1.0
@@ -206,109 +325,110 @@ def analyze_channel(channel_item, video_items):
 	uploads_per_week = dated_videos_count / weeks_span if weeks_span > 0 else 0.0
 	
 	# For overall counts, use all videos (including those without dates)
-	shorts_mask = dfv['duration_seconds'] <= SHORTS_THRESHOLD_SECONDS
-	shorts_count = shorts_mask.sum()
-	longs_count = total_videos - shorts_count
+	shorts_count = len(shorts)
+	longs_count = len(longs)
 	
 	# Per-week rates should use dated videos only for accuracy
 	shorts_per_week = shorts_count_dated / weeks_span if weeks_span > 0 else 0.0
 	longs_per_week = longs_count_dated / weeks_span if weeks_span > 0 else 0.0
 
-	avg_runtime_long = _safe_float(dfv.loc[~shorts_mask, 'duration_seconds'].mean() if longs_count>0 else 0.0)
-	avg_runtime_shorts = _safe_float(dfv.loc[shorts_mask, 'duration_seconds'].mean() if shorts_count>0 else 0.0)
-	avg_views = _safe_float(dfv['views'].mean())
+	avg_runtime_long = _safe_float(duration_seconds[longs].mean() if longs_count>0 else 0.0)
+	avg_runtime_shorts = _safe_float(duration_seconds[shorts].mean() if shorts_count>0 else 0.0)
+	# Sum the three count columns in one reduction; the means follow from the sums
+	total_views, total_likes, total_comments = np.stack([views, likes, comments]).sum(axis=1)
+	avg_views = _safe_float(total_views / total_videos)
 
 	n_top = max(1, math.ceil(0.10 * total_videos))
-	top_videos = dfv.nlargest(n_top, 'views')
+	top_videos = _top_n(views, n_top)
 	# Avoid divide-by-zero by excluding rows with zero views for per-video ratios
-	_top_nonzero = top_videos[top_videos['views'] > 0]
-	top_engagement_pct = (((_top_nonzero['likes'] + _top_nonzero['comments']) / _top_nonzero['views']).mean() * 100) if not _top_nonzero.empty else 0
+	_top_nonzero = top_videos[views[top_videos] > 0]
+	top_engagement_pct = (((likes[_top_nonzero] + comments[_top_nonzero]) / views[_top_nonzero]).mean() * 100) if len(_top_nonzero) else 0
 
-	longs = dfv.loc[~shorts_mask]
-	shorts = dfv.loc[shorts_mask]
-	top5_longs = longs.nlargest(5, 'views')['title'].tolist() if not longs.empty else []
-	top5_shorts = shorts.nlargest(5, 'views')['title'].tolist() if not shorts.empty else []
+	top5_longs = [titles[i] for i in longs[_top_n(views[longs], 5)]]
+	top5_shorts = [titles[i] for i in shorts[_top_n(views[shorts], 5)]]
 
 	cta_counter = Counter()
 	monet_counter = Counter()
 	community_counter = Counter()
 	videos_with_community_keywords = 0
-	for desc in dfv['description'].astype(str):
-		d = desc.lower()
+	for desc in descriptions:
+		# Many videos have no description at all; nothing to scan
+		if not desc:
+			continue
+		d = str(desc).lower()
+		# `kw in found` is a set lookup after the automaton pass, or a substring
+		# search per keyword without pyahocorasick
+		found = {kw for _, kw in _KEYWORD_AUTOMATON.iter(d)} if _KEYWORD_AUTOMATON else d
 		has_community = False
 		for kw in CTA_WORDS:
-			if kw in d:
+			if kw in found:
 				cta_counter[kw]+=1
 		for kw in MONET_WORDS:
-			if kw in d:
+			if kw in found:
 				monet_counter[kw]+=1
 		for kw in COMMUNITY_WORDS:
-			if kw in d:
+			if kw in found:
 				community_counter[kw]+=1
 				has_community = True
 		if has_community:
 			videos_with_community_keywords += 1
 
-	# Extract topics from video titles
-	tokens = []
-	for t in dfv['title'].astype(str):
-		toks = re.findall(r"[A-Za-z0-9+#]+", t.lower())
-		tokens.extend(toks)
-	
-	# Comprehensive stopword list to filter out common filler words
-	stopwords = set([
-		# Articles, prepositions, conjunctions
-		'the', 'and', 'for', 'with', 'to', 'a', 'an', 'in', 'of', 'is', 'at', 'by', 'on',
-		# Common verbs
-		'how', 'what', 'learn', 'get', 'make', 'use', 'do', 'can', 'will', 'should',
-		# Tutorial/video-related words
-		'tutorial', 'lesson', 'video', 'introduction', 'session', 'guide', 'course',
-		'part', 'episode', 'series', 'chapter', 'lecture',
-		# Common adjectives/qualifiers
-		'new', 'best', 'top', 'this', 'that', 'your', 'from', 'all', 'about', 'into',
-		'complete', 'full', 'easy', 'simple', 'quick', 'free', 'basic', 'advanced',
-		# Time-related
-		'2023', '2024', '2025', 'today', 'now',
-		# Numbers (filter 1-20 as they're usually not meaningful topics)
-		'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten'
-	])
-	filtered = [w for w in tokens if w not in stopwords and len(w) > 2]
+	# Extract topics from video titles: join them, lowercase the result in one
+	# call and tokenize it with a single regex pass (the separator is outside
+	# the token class and, being uncased, does not change how the titles lowercase)
+	tokens = _TOKEN_RE.findall('\x01'.join(map(str, titles)).lower())
+	filtered = [w for w in tokens if w not in TOPIC_STOPWORDS and len(w) > 2]
 	top_topics = [w for w, c in Counter(filtered).most_common(20)]
 
-	# Build weekly aggregation only from rows with valid dates
-	if not dfv_dates.empty:
-		dfv_dates = dfv_dates.copy()
-		dfv_dates['week'] = dfv_dates['publishedAt'].dt.to_period('W').apply(lambda r: r.start_time)
-		weekly_views = dfv_dates.groupby('week')['views'].sum().reset_index()
-		weekly_views['week_index'] = range(len(weekly_views))
+	# Build weekly aggregation only from rows with valid dates: total views per
+	# Monday-to-Sunday week (as with to_period('W')), oldest week first
+	if dated.any():
+		days = published[:dated_videos_count].astype('datetime64[D]').astype(np.int64)
+		# Day 0 (1970-01-01) was a Thursday, so (days + 3) % 7 is 0 on Mondays
+		week_start = days - (days + 3) % 7
+		# The dates are sorted, so each week is one contiguous run of rows
+		run_starts = np.flatnonzero(np.r_[True, week_start[1:] != week_start[:-1]])
+		weekly_views = np.add.reduceat(views[:dated_videos_count], run_starts)
 	else:
-		weekly_views = pd.DataFrame(columns=['week','views','week_index'])
+		weekly_views = np.zeros(0, dtype=np.int64)
 
 	# Forecast total views over the next FUTURE_WEEKS using a simple linear trend,
 	# clipping negative weekly predictions and providing sensible fallbacks.
 	est_views_6m = None
 	if len(weekly_views) >= 2:
-		x = weekly_views['week_index'].values
-		y = weekly_views['views'].values
+		x = np.arange(len(weekly_views))
+		y = weekly_views
 		# Filter out any invalid values
 		valid_mask = np.isfinite(y) & (y >= 0)
 		if valid_mask.sum() >= 2:
 			x_valid = x[valid_mask]
 			y_valid = y[valid_mask]
 			try:
-				slope, intercept = np.polyfit(x_valid, y_valid, 1)
+				# Closed-form least-squares line; np.polyfit would go through a
+				# LAPACK solver for what is a handful of arithmetic operations.
+				# x holds at least two distinct week indices, so dx is never all zero.
+				x_mean = x_valid.mean()
+				y_mean = y_valid.mean()
+				dx = x_valid - x_mean
+				slope = (dx * (y_valid - y_mean)).sum() / (dx * dx).sum()
+				intercept = y_mean - slope * x_mean
 				# Use the last valid week index to project forward
-				last_week_index = x_valid[-1]
-				future_x = np.arange(last_week_index + 1, last_week_index + 1 + FUTURE_WEEKS)
-				future_y = intercept + slope * future_x
-				future_y = np.maximum(0, future_y)
-				est_views_6m = float(future_y.sum())
+				first_x = x_valid[-1] + 1
+				last_x = first_x + FUTURE_WEEKS - 1
+				if intercept + slope * first_x >= 0 and intercept + slope * last_x >= 0:
+					# A line that is non-negative at both ends is non-negative
+					# throughout, so nothing is clipped: sum the arithmetic series
+					est_views_6m = float(FUTURE_WEEKS * intercept + slope * (FUTURE_WEEKS * (first_x + last_x) / 2))
+				else:
+					future_y = intercept + slope * np.arange(first_x, last_x + 1)
+					future_y = np.maximum(0, future_y)
+					est_views_6m = float(future_y.sum())
 				# If forecast is zero or negative, use recent average instead
 				if est_views_6m <= 0:
 					recent_weeks = min(8, len(y_valid))
 					avg_recent_weekly = float(np.mean(y_valid[-recent_weeks:])) if len(y_valid) > 0 else 0.0
 					est_views_6m = max(0.0, avg_recent_weekly * FUTURE_WEEKS)
-			except (np.linalg.LinAlgError, ValueError, TypeError):
+			except (ValueError, TypeError):
 				# Fallback to mean if regression fails
 				avg_weekly_views = float(np.mean(y_valid)) if len(y_valid) > 0 else 0.0
 				est_views_6m = max(0.0, avg_weekly_views * FUTURE_WEEKS)
@@ -318,7 +438,7 @@ def analyze_channel(channel_item, video_items):
 			est_views_6m = max(0.0, avg_weekly_views * FUTURE_WEEKS)
 	elif len(weekly_views) == 1:
 		# Single week: use that week's views, but be conservative (don't assume it's typical)
-		single_week_views = float(weekly_views['views'].iloc[0])
+		single_week_views = float(weekly_views[0])
 		if single_week_views > 0 and np.isfinite(single_week_views):
 			est_views_6m = max(0.0, single_week_views * FUTURE_WEEKS)
 		else:
@@ -338,9 +458,8 @@ def analyze_channel(channel_item, video_items):
 		est_subs_6m = 0
 
 	# Calculate overall engagement rate with proper handling of edge cases
-	total_views = dfv['views'].sum()
 	if total_views > 0:
-		engagement_rate_overall = _safe_float((dfv['likes'].sum() + dfv['comments'].sum()) / total_views, 0.0)
+		engagement_rate_overall = _safe_float((total_likes + total_comments) / total_views, 0.0)
 	else:
 		engagement_rate_overall = 0.0
 	
@@ -387,7 +506,7 @@ def analyze_channel(channel_item, video_items):
 	#    - Proportion of videos mentioning community-building keywords
 	#    - Keywords: discord, telegram, community, facebook group, newsletter, etc.
 	#    - Note: May have false positives (e.g., "discord bot tutorial")
-	avg_comments = _safe_float(dfv['comments'].mean())
+	avg_comments = _safe_float(total_comments / total_videos)
 	# Community presence: proportion of videos with community-related keywords
 	community_presence = min(1.0, max(0.0, videos_with_community_keywords / max(1, total_videos)))
 	# Comments: 10 per video = 1.0 score
@@ -428,3 +547,18 @@ def analyze_channel(channel_item, video_items):
 	return result
 
 
+def _analyze_pair(pair):
+	return analyze_channel(*pair)
+
+
+def analyze_channels(pairs, max_workers=None) -> list:
+	"""Run analyze_channel over ``(channel_item, video_items)`` pairs in worker processes.
+
+	Each channel is independent, so batch callers can use every core; results
+	come back in input order. A single pair is analyzed in-process.
+	"""
+	pairs = list(pairs)
+	if len(pairs) <= 1 or max_workers == 1:
+		return [analyze_channel(*pair) for pair in pairs]
+	with ProcessPoolExecutor(max_workers=max_workers) as pool:
+		return list(pool.map(_analyze_pair, pairs))
@@ -0,0 +1,199 @@
+"""
+Metadata Cache Module
+
+Persists YouTube API responses in a local SQLite database so that re-running
+an analysis (e.g. with a different date filter) does not re-fetch the same
+channels, upload listings and videos, saving both time and API quota.
+Analyses of unchanged channels are memoized as well.
+
+Classes:
+- MetadataCache: SQLite-backed cache for channel, uploads and video-details responses and analyses
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'cache', 'metadata.sqlite3')
+
+# SQLite limits the number of bound parameters per statement (999 on older builds)
+_SQL_BATCH = 500
+
+
+class MetadataCache:
+	"""Thread-safe cache of channel and video-details API items.
+
+	Each entry stores the raw API item as JSON together with the time it was
+	fetched; lookups take a ``max_age`` in seconds and ignore older entries.
+	Database errors are treated as cache misses so a broken cache never stops
+	an analysis. Hits and misses are counted per item; see ``stats()``.
+	"""
+
+	def __init__(self, path: str = DEFAULT_CACHE_PATH):
+		self.path = path
+		cache_dir = os.path.dirname(path)
+		if cache_dir:
+			os.makedirs(cache_dir, exist_ok=True)
+		self._lock = threading.Lock()
+		self._hits = 0
+		self._misses = 0
+		with self._lock, closing(self._connect()) as conn:
+			conn.execute('CREATE TABLE IF NOT EXISTS channels (id TEXT PRIMARY KEY, json TEXT, fetched_at REAL)')
+			conn.execute('CREATE TABLE IF NOT EXISTS uploads (id TEXT PRIMARY KEY, json TEXT, fetched_at REAL)')
+			conn.execute('CREATE TABLE IF NOT EXISTS video_details (video_id TEXT PRIMARY KEY, json TEXT, fetched_at REAL)')
+			conn.execute('CREATE TABLE IF NOT EXISTS analyses (id TEXT PRIMARY KEY, json TEXT, fetched_at REAL)')
+			# Caches created before ETags were stored lack the column
+			columns = {row[1] for row in conn.execute('PRAGMA table_info(channels)')}
+			if 'etag' not in columns:
+				conn.execute('ALTER TABLE channels ADD COLUMN etag TEXT')
+			conn.commit()
+
+	def _connect(self):
+		return sqlite3.connect(self.path, timeout=30)
+
+	def _count(self, hits: int, misses: int):
+		# Callers already hold self._lock
+		self._hits += hits
+		self._misses += misses
+
+	def _get(self, table: str, key: str, max_age: float):
+		row = None
+		try:
+			with self._lock, closing(self._connect()) as conn:
+				row = conn.execute(
+					f'SELECT json FROM {table} WHERE id = ? AND fetched_at >= ?',
+					(key, time.time() - max_age),
+				).fetchone()
+				self._count(1 if row else 0, 0 if row else 1)
+		except sqlite3.Error:
+			return None
+		return json.loads(row[0]) if row else None
+
+	def _put(self, table: str, key: str, value):
+		try:
+			with self._lock, closing(self._connect()) as conn:
+				conn.execute(
+					f'INSERT OR REPLACE INTO {table} (id, json, fetched_at) VALUES (?, ?, ?)',
+					(key, json.dumps(value), time.time()),
+				)
+				conn.commit()
+		except sqlite3.Error:
+			pass
+
+	def get_channel(self, identifier: str, max_age: float):
+		"""Return the cached channel item for ``identifier``, or None if missing/stale."""
+		return self._get('channels', identifier, max_age)
+
+	def put_channel(self, identifier: str, item: dict, etag: str | None = None):
+		try:
+			with self._lock, closing(self._connect()) as conn:
+				conn.execute(
+					'INSERT OR REPLACE INTO channels (id, json, fetched_at, etag) VALUES (?, ?, ?, ?)',
+					(identifier, json.dumps(item), time.time(), etag),
+				)
+				conn.commit()
+		except sqlite3.Error:
+			pass
+
+	def stale_channel_ids(self, identifiers: list[str], max_age: float) -> list[str]:
+		"""Return the identifiers with no fresh cached entry (not counted in the statistics)."""
+		fresh = set()
+		cutoff = time.time() - max_age
+		try:
+			with self._lock, closing(self._connect()) as conn:
+				for i in range(0, len(identifiers), _SQL_BATCH):
+					batch = identifiers[i:i+_SQL_BATCH]
+					placeholders = ','.join('?' * len(batch))
+					rows = conn.execute(
+						f'SELECT id FROM channels WHERE id IN ({placeholders}) AND fetched_at >= ?',
+						(*batch, cutoff),
+					)
+					fresh.update(row[0] for row in rows)
+		except sqlite3.Error:
+			return list(identifiers)
+		return [i for i in identifiers if i not in fresh]
+
+	def get_channel_etag(self, identifier: str):
+		"""Return ``(item, etag)`` for ``identifier`` regardless of age, or ``(None, None)``.
+
+		Used to revalidate a stale entry with a conditional request; not counted
+		in the hit/miss statistics.
+		"""
+		try:
+			with self._lock, closing(self._connect()) as conn:
+				row = conn.execute('SELECT json, etag FROM channels WHERE id = ?', (identifier,)).fetchone()
+		except sqlite3.Error:
+			return None, None
+		return (json.loads(row[0]), row[1]) if row else (None, None)
+
+	def get_uploads(self, playlist_id: str, max_age: float):
+		"""Return the cached list of video IDs in an uploads playlist, or None if missing/stale."""
+		return self._get('uploads', playlist_id, max_age)
+
+	def put_uploads(self, playlist_id: str, video_ids: list[str]):
+		self._put('uploads', playlist_id, video_ids)
+
+	def get_analysis(self, key: str, max_age: float):
+		"""Return the analysis stored under ``key``, or None (not counted in the statistics)."""
+		try:
+			with self._lock, closing(self._connect()) as conn:
+				row = conn.execute(
+					'SELECT json FROM analyses WHERE id = ? AND fetched_at >= ?',
+					(key, time.time() - max_age),
+				).fetchone()
+		except sqlite3.Error:
+			return None
+		return json.loads(row[0]) if row else None
+
+	def put_analysis(self, key: str, analysis: dict):
+		self._put('analyses', key, analysis)
+
+	def get_many(self, video_ids: list[str], max_age: float) -> dict:
+		"""Return ``{video_id: item}`` for the fresh cached entries among ``video_ids``."""
+		found = {}
+		cutoff = time.time() - max_age
+		try:
+			with self._lock, closing(self._connect()) as conn:
+				for i in range(0, len(video_ids), _SQL_BATCH):
+					batch = video_ids[i:i+_SQL_BATCH]
+					placeholders = ','.join('?' * len(batch))
+					rows = conn.execute(
+						f'SELECT video_id, json FROM video_details WHERE video_id IN ({placeholders}) AND fetched_at >= ?',
+						(*batch, cutoff),
+					)
+					for vid, payload in rows:
+						found[vid] = json.loads(payload)
+				self._count(len(found), len(video_ids) - len(found))
+		except sqlite3.Error:
+			return {}
+		return found
+
+	def put_many(self, items: list[dict]):
+		now = time.time()
+		rows = [(it['id'], json.dumps(it), now) for it in items if it.get('id')]
+		try:
+			with self._lock, closing(self._connect()) as conn:
+				conn.executemany('INSERT OR REPLACE INTO video_details (video_id, json, fetched_at) VALUES (?, ?, ?)', rows)
+				conn.commit()
+		except sqlite3.Error:
+			pass
+
+	def stats(self) -> tuple[int, int]:
+		"""Return ``(hits, misses)`` counted since creation or the last ``reset_stats()``."""
+		with self._lock:
+			return self._hits, self._misses
+
+	def reset_stats(self):
+		with self._lock:
+			self._hits = 0
+			self._misses = 0
+
+	def clear(self):
+		with self._lock, closing(self._connect()) as conn:
+			conn.execute('DELETE FROM channels')
+			conn.execute('DELETE FROM uploads')
+			conn.execute('DELETE FROM video_details')
+			conn.execute('DELETE FROM analyses')
+			conn.commit()
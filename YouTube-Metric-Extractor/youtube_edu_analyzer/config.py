@@ -9,6 +9,10 @@ Functions:
 """
 import json
 import os
+from functools import lru_cache
+
+# Path of the API key file: ../config/api_key.json
+API_KEY_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', 'api_key.json')
 
 
 def load_api_key() -> str:
@@ -16,19 +20,31 @@ def load_api_key() -> str:
     Loads the YouTube API key from config/api_key.json.
     If the file or folder doesn't exist, it creates them with a placeholder key.
     Returns the API key string (or an empty string if not set).
+
+    The result is cached until the file's modification time changes, so
+    repeated calls only cost a stat().
     """
-    # Define the path: ../config/api_key.json
-    config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', 'api_key.json')
+    try:
+        mtime = os.stat(API_KEY_PATH).st_mtime_ns
+    except OSError:
+        mtime = None
+    return _load_api_key(mtime)
+
+
+@lru_cache(maxsize=1)
+def _load_api_key(mtime) -> str:
+    config_path = API_KEY_PATH
 
-    # Ensure the config directory exists
+    # Ensure the config directory exists (exist_ok makes a separate check redundant)
     config_dir = os.path.dirname(config_path)
-    if config_dir and not os.path.exists(config_dir):
+    if config_dir:
         os.makedirs(config_dir, exist_ok=True)
 
     api_key = ''
 
-    # If config file doesn't exist, create it with a placeholder key
-    if not os.path.exists(config_path):
+    # If config file doesn't exist (load_api_key already stat'ed it), create it
+    # with a placeholder key
+    if mtime is None:
         default_data = {"api_key": "YOUR_YOUTUBE_API_KEY_HERE"}
         with open(config_path, 'w', encoding='utf-8') as f:
             json.dump(default_data, f, indent=4)
@@ -7,23 +7,116 @@ Handles channel lookups, video fetching, and error handling.
 Classes:
 - YouTubeClient: Main client for YouTube API interactions
 """
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+
+
+# Upper bound on in-flight API requests across all threads sharing a client
+MAX_CONCURRENT_REQUESTS = 8
+# videos.list and channels.list accept at most 50 IDs per call
+VIDEO_BATCH_SIZE = 50
+CHANNEL_BATCH_SIZE = 50
+# Canonical channel IDs ("UC" + 22 characters); only these can be looked up
+# by ID in bulk, handles and legacy names need one request each
+CHANNEL_ID_RE = re.compile(r'^UC[A-Za-z0-9_-]{22}$')
+# Returned by get_channel_with_etag when the API answers 304 Not Modified
+NOT_MODIFIED = object()
+
+# Transient failures are retried with exponential backoff (1s, 2s, 4s, ...
+# plus jitter, capped at MAX_BACKOFF_SECONDS) up to MAX_RETRIES times
+MAX_RETRIES = 5
+MAX_BACKOFF_SECONDS = 60
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# 403 is also used for short-term rate limits, which clear by waiting; an
+# exhausted daily quota ('quotaExceeded') does not, so it is not retried
+RATE_LIMIT_REASONS = (b'rateLimitExceeded', b'userRateLimitExceeded')
+
+
+def _is_retryable(error: Exception) -> bool:
+	if isinstance(error, HttpError):
+		status = error.resp.status
+		if status in RETRY_STATUSES:
+			return True
+		return status == 403 and any(r in (error.content or b'') for r in RATE_LIMIT_REASONS)
+	# Dropped or timed-out connections
+	return isinstance(error, (ConnectionError, TimeoutError))
 
 
 class YouTubeClient:
-	def __init__(self, api_key: str):
+	def __init__(self, api_key: str, on_retry=None):
+		"""``on_retry``, if given, is called with a message before each retry."""
 		if not api_key:
 			raise ValueError('You must provide a YouTube API key')
-		self.client = build('youtube', 'v3', developerKey=api_key)
+		# Build from the discovery document bundled with google-api-python-client
+		# (no HTTPS fetch) and skip the discovery file cache, which only works
+		# with the legacy oauth2client and otherwise logs a warning per build
+		self.client = build('youtube', 'v3', developerKey=api_key, static_discovery=True, cache_discovery=False)
+		self._request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+		# httplib2.Http is not thread-safe, so instead of sharing one connection
+		# each request borrows an idle Http from this pool. Connections stay
+		# open between requests (keep-alive), avoiding a new TLS handshake per
+		# call; the semaphore bounds the pool at MAX_CONCURRENT_REQUESTS.
+		# Connections come from build_http, like the client's own, so they get
+		# its socket timeout and a stalled request raises instead of hanging.
+		self._idle_http = []
+		self._pool_lock = threading.Lock()
+
+		self._on_retry = on_retry
+
+	def _execute(self, request):
+		"""Execute an API request on a pooled connection, retrying transient failures."""
+		for attempt in range(MAX_RETRIES + 1):
+			try:
+				return self._execute_once(request)
+			except Exception as e:
+				if attempt == MAX_RETRIES or not _is_retryable(e):
+					raise
+				delay = min(MAX_BACKOFF_SECONDS, 2 ** attempt + random.random())
+				if self._on_retry:
+					reason = e.resp.status if isinstance(e, HttpError) else type(e).__name__
+					self._on_retry(f'API request failed ({reason}); retrying in {delay:.1f}s (attempt {attempt + 1} of {MAX_RETRIES})')
+				# Sleep without holding a request slot so other threads can proceed
+				time.sleep(delay)
+
+	def _execute_once(self, request):
+		with self._request_slots:
+			with self._pool_lock:
+				http = self._idle_http.pop() if self._idle_http else build_http()
+			try:
+				request.http = http
+				return request.execute()
+			finally:
+				with self._pool_lock:
+					self._idle_http.append(http)
 
 	def get_channel(self, identifier: str):
+		return self.get_channel_with_etag(identifier)[0]
+
+	def get_channel_with_etag(self, identifier: str, etag: str | None = None):
+		"""Look up a channel, revalidating a previous response when ``etag`` is given.
+
+		Returns ``(item, etag)`` where ``etag`` is the ETag of the channels.list
+		response. If the channel is unchanged since ``etag`` was issued the API
+		answers 304 with no body and ``(NOT_MODIFIED, etag)`` is returned.
+		"""
 		try:
-			res = self.client.channels().list(part='snippet,statistics,contentDetails', id=identifier).execute()
+			request = self.client.channels().list(part='snippet,statistics,contentDetails', id=identifier)
+			if etag:
+				request.headers['If-None-Match'] = etag
+			res = self._execute(request)
 			if res.get('items'):
-				return res['items'][0]
+				return res['items'][0], res.get('etag')
 		except HttpError as e:
-			if e.resp.status == 403:
+			if e.resp.status == 304:
+				return NOT_MODIFIED, etag
+			elif e.resp.status == 403:
 				raise ValueError(f'API quota exceeded or access denied. Error: {e}')
 			elif e.resp.status == 404:
 				# Channel not found by ID, try search
@@ -35,19 +128,45 @@ class YouTubeClient:
 		
 		# Try search if direct ID lookup failed
 		try:
-			res = self.client.search().list(part='snippet', q=identifier, type='channel', maxResults=1).execute()
+			res = self._execute(self.client.search().list(part='snippet', q=identifier, type='channel', maxResults=1))
 			if res.get('items'):
 				cid = res['items'][0]['snippet']['channelId']
-				res2 = self.client.channels().list(part='snippet,statistics,contentDetails', id=cid).execute()
+				res2 = self._execute(self.client.channels().list(part='snippet,statistics,contentDetails', id=cid))
 				if res2.get('items'):
-					return res2['items'][0]
+					# The ETag belongs to a lookup by the resolved ID, not by
+					# ``identifier``, so it can't be used to revalidate it
+					return res2['items'][0], None
 		except HttpError as e:
 			if e.resp.status == 403:
 				raise ValueError(f'API quota exceeded or access denied. Error: {e}')
 			# If search also fails, return None (channel not found)
 		except Exception as e:
 			raise ValueError(f'Unexpected error while searching for channel: {e}')
-		return None
+		return None, None
+
+	def _get_channels_batch(self, batch: list[str]):
+		return self._execute(self.client.channels().list(part='snippet,statistics,contentDetails', id=','.join(batch), maxResults=CHANNEL_BATCH_SIZE))
+
+	def get_channels_bulk(self, channel_ids: list[str]) -> dict:
+		"""Look up channels by ID, up to 50 per request.
+
+		Returns ``{channel_id: item}``; IDs that don't exist are omitted.
+		"""
+		out = {}
+		batches = [channel_ids[i:i+CHANNEL_BATCH_SIZE] for i in range(0, len(channel_ids), CHANNEL_BATCH_SIZE)]
+		try:
+			with ThreadPoolExecutor(max_workers=max(1, min(MAX_CONCURRENT_REQUESTS, len(batches)))) as pool:
+				for resp in pool.map(self._get_channels_batch, batches):
+					for item in resp.get('items', []):
+						out[item['id']] = item
+		except HttpError as e:
+			if e.resp.status == 403:
+				raise ValueError(f'API quota exceeded or access denied. Error: {e}')
+			else:
+				raise ValueError(f'API error while fetching channels: {e}')
+		except Exception as e:
+			raise ValueError(f'Unexpected error while fetching channels: {e}')
+		return out
 
 	def get_videos_from_uploads(self, uploads_playlist_id: str, max_videos: int | None):
 		vids = []
@@ -55,7 +174,7 @@ class YouTubeClient:
 		fetched = 0
 		try:
 			while True:
-				resp = self.client.playlistItems().list(part='contentDetails', playlistId=uploads_playlist_id, maxResults=50, pageToken=nextPage).execute()
+				resp = self._execute(self.client.playlistItems().list(part='contentDetails', playlistId=uploads_playlist_id, maxResults=50, pageToken=nextPage))
 				for it in resp.get('items', []):
 					vids.append(it['contentDetails']['videoId'])
 					fetched += 1
@@ -75,13 +194,18 @@ class YouTubeClient:
 			raise ValueError(f'Unexpected error while fetching videos from playlist: {e}')
 		return vids
 
+	def _get_videos_batch(self, batch: list[str]):
+		return self._execute(self.client.videos().list(part='snippet,contentDetails,statistics', id=','.join(batch), maxResults=VIDEO_BATCH_SIZE))
+
 	def get_videos_details(self, video_ids: list[str]):
 		out = []
+		batches = [video_ids[i:i+VIDEO_BATCH_SIZE] for i in range(0, len(video_ids), VIDEO_BATCH_SIZE)]
 		try:
-			for i in range(0, len(video_ids), 50):
-				batch = video_ids[i:i+50]
-				resp = self.client.videos().list(part='snippet,contentDetails,statistics', id=','.join(batch), maxResults=50).execute()
-				out.extend(resp.get('items', []))
+			# Batches are independent, so fetch them concurrently; map() keeps
+			# the results in request order
+			with ThreadPoolExecutor(max_workers=max(1, min(MAX_CONCURRENT_REQUESTS, len(batches)))) as pool:
+				for resp in pool.map(self._get_videos_batch, batches):
+					out.extend(resp.get('items', []))
 		except HttpError as e:
 			if e.resp.status == 403:
 				raise ValueError(f'API quota exceeded or access denied while fetching video details. Error: {e}')